@@ -0,0 +1,27 @@
+"""
+Merge two XML files based on join properties and optionally output the merged data to a new XML file.
+"""
+from merge_xml.cli import main, parse_command_line_args
+from merge_xml.io import merge_files_streaming, parse_xml_files, stream_records, write_merged_data_to_file
+from merge_xml.join import LeftOuterJoinStrategy, MergeStrategy, RightOuterJoinStrategy, merge_data
+from merge_xml.paths import has_xml_extension, is_valid_filename, is_writable_directory, validate_output_filename
+from merge_xml.validate import validate_props_xpath, validate_xml_data
+
+__all__ = [
+    'LeftOuterJoinStrategy',
+    'MergeStrategy',
+    'RightOuterJoinStrategy',
+    'has_xml_extension',
+    'is_valid_filename',
+    'is_writable_directory',
+    'main',
+    'merge_data',
+    'merge_files_streaming',
+    'parse_command_line_args',
+    'parse_xml_files',
+    'stream_records',
+    'validate_output_filename',
+    'validate_props_xpath',
+    'validate_xml_data',
+    'write_merged_data_to_file',
+]
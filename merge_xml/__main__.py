@@ -0,0 +1,7 @@
+"""
+Entry point for python -m merge_xml.
+"""
+from merge_xml.cli import main
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Command line interface for merging two XML files.
+"""
+import argparse
+import concurrent.futures
+import functools
+import os
+import sys
+
+from merge_xml.io import merge_files_streaming, parse_xml_files, write_merged_data_to_file
+from merge_xml.join import LeftOuterJoinStrategy, RightOuterJoinStrategy, merge_data
+from merge_xml.paths import validate_output_filename
+from merge_xml.validate import validate_props_xpath, validate_xml_data
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser, constructing it at most once per process.
+
+    Returns:
+        argparse.ArgumentParser: The argument parser
+    """
+    parser = argparse.ArgumentParser(prog='merge_xml', description='Merge two XML files based on join properties')
+    # Required left file, right file, and join properties
+    parser.add_argument('left_file', help='Path to the left XML file')
+    parser.add_argument('right_file', help='Path to the right XML file')
+    parser.add_argument('join_properties', nargs='+', help='List of join properties as xpath strings')
+    # Optional output file name
+    parser.add_argument('-o', '--output', help='Path to the output XML file', default=None)
+    # Optional merge strategy
+    parser.add_argument('-s', '--strategy', help='Merge strategy', choices=['left', 'right'], default='left')
+    # Optional streaming mode for large files
+    parser.add_argument('--stream', action='store_true',
+                        help='Stream the merge record by record instead of building the full trees (skips schema validation)')
+    # Optional schema cross-validation
+    parser.add_argument('--validate-schemas', action='store_true',
+                        help='Build a schema from each file and cross-validate it against the other file')
+
+    return parser
+
+
+def parse_command_line_args() -> argparse.Namespace:
+    """Parse the command line arguments and return the file names, properties, and output file name.
+
+    Returns:
+        argparse.Namespace: The parsed command line arguments
+    """
+    args = _build_parser().parse_args()
+    # Interned property names share one object per string, so the dict and set
+    # probes keyed on them downstream hit the pointer-equality fast path
+    args.join_properties = [sys.intern(prop) for prop in args.join_properties]
+    return args
+
+
+def main() -> None:
+    """
+    Main function
+    """
+    # Parse the command line arguments
+    args = parse_command_line_args()
+    # Normalize and validate the output file name if it is provided; realpath
+    # also resolves symlinks so the checks see the same path the write will use
+    if args.output is not None:
+        args.output = os.path.realpath(args.output)
+        validate_output_filename(args.output)
+    # Validate the xpath strings, keeping the compiled xpaths for the merge stage
+    compiled_props = validate_props_xpath(args.join_properties)
+    # In streaming mode, merge record by record without building the full trees
+    if args.stream:
+        if args.strategy == 'right':
+            # A right outer join is a left outer join with the files swapped
+            merge_files_streaming(args.right_file, args.left_file, compiled_props, args.output)
+        else:
+            merge_files_streaming(args.left_file, args.right_file, compiled_props, args.output)
+        return
+    # Parse the XML files in parallel (libxml2 releases the GIL while parsing),
+    # only building schemas when cross-validation was requested
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        left_future = executor.submit(parse_xml_files, args.left_file, build_schema=args.validate_schemas)
+        right_future = executor.submit(parse_xml_files, args.right_file, build_schema=args.validate_schemas)
+        left_data, left_schema = left_future.result()
+        right_data, right_schema = right_future.result()
+    # Validate the XML data
+    validate_xml_data(left_data, left_schema, right_data, right_schema, args.join_properties)
+    # Merge the data, using the args.strategy to specify the merge strategy
+    if args.strategy == 'right':
+        merge_strategy = RightOuterJoinStrategy()
+    else:
+        merge_strategy = LeftOuterJoinStrategy()
+    merged_data = merge_data(left_data, right_data, compiled_props, merge_strategy)
+    # Write the merged data to the output file
+    write_merged_data_to_file(merged_data, args.output)
@@ -0,0 +1,143 @@
+"""
+Parsing, streaming, and serialization of the XML files.
+"""
+import concurrent.futures
+import contextlib
+import sys
+from typing import Iterator, Mapping, Tuple
+
+from lxml import etree
+
+from merge_xml.join import make_key_func
+
+# Files are read and written through a 1 MiB buffer so the parser and the
+# incremental writer issue few large transfers instead of many page-sized ones
+_FILE_BUFFER_SIZE = 1 << 20
+
+
+@contextlib.contextmanager
+def _open_output(output_file: str):
+    """Yield a buffered binary sink for the output file, or stdout's buffer.
+
+    Args:
+        output_file (str): The output file path, or None for stdout
+
+    Yields:
+        BinaryIO: The sink to serialize into
+    """
+    if output_file:
+        with open(output_file, 'wb', buffering=_FILE_BUFFER_SIZE) as handle:
+            yield handle
+    else:
+        yield sys.stdout.buffer
+
+
+def parse_xml_files(xml_file: str, build_schema: bool = False) -> Tuple[etree._Element, etree.XMLSchema]:
+    """
+    Parse XML file that returns a tuple of the root element and the schema.
+
+    Compiling an XMLSchema roughly doubles the parse cost, so it is skipped
+    (the second tuple member is None) unless build_schema is True.
+    """
+    parser = etree.XMLParser(resolve_entities=False, strip_cdata=False, huge_tree=True, collect_ids=False)
+    with open(xml_file, 'rb', buffering=_FILE_BUFFER_SIZE) as file:
+        tree = etree.parse(file, parser=parser)
+    schema_root = etree.XMLSchema(tree) if build_schema else None
+    root = tree.getroot()
+    return root, schema_root
+
+
+def stream_records(xml_file: str, record_tag: str = None) -> Iterator[etree._Element]:
+    """Stream the top-level record elements of an XML file one at a time.
+
+    Each record is cleared (and its already-consumed siblings dropped) once the
+    caller has seen it, so peak memory stays at one record rather than the whole
+    document. Records must therefore be fully processed before advancing.
+
+    Args:
+        xml_file (str): The XML file path
+        record_tag (str, optional): Only yield records with this tag. Defaults to None (all records).
+
+    Yields:
+        etree._Element: Each direct child of the document root
+    """
+    with open(xml_file, 'rb', buffering=_FILE_BUFFER_SIZE) as file:
+        context = etree.iterparse(file, events=('end',), tag=record_tag, resolve_entities=False)
+        for _, elem in context:
+            parent = elem.getparent()
+            # Only direct children of the root are records
+            if parent is None or parent.getparent() is not None:
+                continue
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+        del context
+
+
+def merge_files_streaming(left_file: str, right_file: str, compiled: Mapping[str, etree.XPath], output_file: str = None) -> None:
+    """Left outer join two XML files without building the merged tree in memory.
+
+    The right file is parsed up front because its unmatched records may need to
+    be appended; the left file is streamed record by record straight into the
+    incremental writer, so peak memory is the right file plus one left record
+    instead of both documents and the merged result.
+
+    Note that schema cross-validation is skipped in this mode as it would
+    require both full trees.
+
+    Args:
+        left_file (str): Path to the left XML file
+        right_file (str): Path to the right XML file
+        compiled (Mapping[str, etree.XPath]): The join properties mapped to their compiled xpaths
+        output_file (str, optional): The output file path. Defaults to None (stdout).
+    """
+    key = make_key_func(compiled)
+    left_keys = set()
+    # The right map is only probed after the left file has streamed through, so
+    # its parse runs on a worker thread concurrently with the left pass
+    # (libxml2 releases the GIL while parsing)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        right_future = executor.submit(parse_xml_files, right_file)
+        with open(left_file, 'rb', buffering=_FILE_BUFFER_SIZE) as left_handle, \
+                _open_output(output_file) as out, \
+                etree.xmlfile(out, encoding='utf-8') as xml_out:
+            xml_out.write_declaration()
+            context = etree.iterparse(left_handle, events=('start', 'end'), resolve_entities=False)
+            _, root = next(context)
+            with xml_out.element(root.tag, root.attrib):
+                for event, elem in context:
+                    if event != 'end' or elem.getparent() is not root:
+                        continue
+                    left_keys.add(key(elem))
+                    xml_out.write(elem)
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del root[0]
+                right_root, _ = right_future.result()
+                right_map = {key(elem): elem for elem in right_root}
+                for join_key, elem in right_map.items():
+                    if join_key not in left_keys:
+                        xml_out.write(elem)
+
+
+def write_merged_data_to_file(xml_data: etree._Element, output_file: str = None) -> None:
+    """
+    Write the merged data to the output file, or to stdout when no file is given.
+
+    The tree is serialized incrementally child by child rather than through
+    etree.tostring, so the output phase never holds a second full copy of the
+    document in memory.
+
+    Args:
+        xml_data (etree._Element): The merged XML data
+        output_file (str, optional): The output file path. Defaults to None.
+    """
+    try:
+        with _open_output(output_file) as out, etree.xmlfile(out, encoding='utf-8') as xml_out:
+            xml_out.write_declaration()
+            with xml_out.element(xml_data.tag, xml_data.attrib):
+                for child in xml_data:
+                    xml_out.write(child)
+    except IOError as io_error:
+        raise IOError(f'Unable to write to output file {output_file}') from io_error
@@ -0,0 +1,74 @@
+"""
+Output path validation helpers.
+"""
+import os
+import re
+from pathlib import PurePath
+
+# Characters that are not allowed in output file names
+_INVALID_FILENAME_RE = re.compile(r'[*?<>|]')
+
+
+def validate_output_filename(out_path: str) -> None:
+    """Validate the output file name and ensure that it is valid, writable and doesn't already exist.
+
+    Args:
+        out_file (str): The output file path
+
+    Raises:
+        ValueError: If the output file name is invalid or already exists
+    """
+
+    # Cheap string checks first so obviously-invalid names never hit the syscall layer
+    if not is_valid_filename(out_path):
+        raise ValueError("The output file name contains invalid characters.")
+
+    # Check if the output file name has the .xml extension
+    if not has_xml_extension(out_path):
+        raise ValueError("The output file name must have the .xml extension.")
+
+    # lexists does a single lstat without resolving a trailing symlink, so a
+    # dangling link at the target still counts as "already exists"
+    if os.path.lexists(out_path):
+        raise ValueError("The output file already exists.")
+
+    # dirname() returns '' for bare filenames, which means the current directory
+    directory = os.path.dirname(out_path) or '.'
+    if not is_writable_directory(directory):
+        raise ValueError("The output directory is not writable.")
+
+
+def is_valid_filename(filename: str) -> bool:
+    """Check if the filename contains any invalid characters.
+
+    Args:
+        filename (str): The filename to check
+
+    Returns:
+        bool: True if the filename is valid, False otherwise
+    """
+    return _INVALID_FILENAME_RE.search(filename) is None
+
+
+def has_xml_extension(filename: str) -> bool:
+    """Check if the filename has the .xml extension.
+
+    Args:
+        filename (str): The filename to check
+
+    Returns:
+        bool: True if the filename has the .xml extension, False otherwise
+    """
+    return PurePath(filename).suffix == ".xml"
+
+
+def is_writable_directory(directory: str) -> bool:
+    """Check if the directory is writable.
+
+    Args:
+        directory (str): The directory to check
+
+    Returns:
+        bool: True if the directory is writable, False otherwise
+    """
+    return os.access(directory, os.W_OK)
@@ -0,0 +1,90 @@
+"""
+Validation of join properties and parsed XML data.
+"""
+from typing import Dict, List
+
+from lxml import etree
+
+from merge_xml.xpath import SIMPLE_TAG_RE, get_xp
+
+
+def validate_props_xpath(props_xpath: List[str]) -> Dict[str, etree.XPath]:
+    """
+    Checks that each xpath string is valid using lxml.
+    If not, throws an error listing each invalid xpath string.
+
+    The compiled xpaths are returned (keyed by the raw string, in input order)
+    so the merge stage can reuse them instead of re-parsing each path.
+    """
+    compiled = {}
+    invalid_props = []
+    for prop in props_xpath:
+        try:
+            compiled[prop] = get_xp(prop)
+        except etree.XPathSyntaxError as ex:
+            invalid_props.append(f"{prop}: {ex}")
+    if invalid_props:
+        error_message = "\n".join(invalid_props)
+        raise ValueError(f"The following xpath strings are invalid:\n\n{error_message}")
+    return compiled
+
+
+def _has_any(root: etree._Element, prop: str, evaluator: etree.XPathEvaluator = None) -> bool:
+    """Check whether a join property matches at least one element under root.
+
+    Tree iteration short-circuits on the first hit, unlike xpath() which always
+    materializes the complete result set. Plain tag names search the whole
+    subtree; anything else goes through the document's XPathEvaluator when one
+    is passed (sharing its evaluation context across properties), falling back
+    to the compiled xpath otherwise.
+
+    Args:
+        root (etree._Element): The root element to search under
+        prop (str): The join property as an xpath string
+        evaluator (etree.XPathEvaluator, optional): An evaluator bound to root's document
+
+    Returns:
+        bool: True if at least one element matches, False otherwise
+    """
+    if SIMPLE_TAG_RE.fullmatch(prop):
+        return next(iter(root.iter(prop)), None) is not None
+    if evaluator is not None:
+        return bool(evaluator(prop))
+    return bool(get_xp(prop)(root))
+
+
+def validate_xml_data(l_data: etree._Element, l_schema: etree.XMLSchema, r_data: etree._Element, r_schema: etree.XMLSchema, join_props_xpath: List[str]) -> None:
+    """
+    Validate XML data
+
+    Args:
+        left_data (etree._Element): The XML data from the left file
+        right_data (etree._Element): The XML data from the right file
+        join_properties (List[str]): The properties to join on as xpath strings
+
+    Raises:
+        ValueError: If the XML schema does not match between the files
+        ValueError: If the join properties do not match to at least one element in both left_data and right_data
+    """
+    errors = []
+    # Each schema is built from its own document, so when both documents
+    # canonicalize identically the cross-checks cannot fail and are skipped
+    same_schema_source = (
+        l_schema is not None and r_schema is not None
+        and etree.tostring(l_data, method='c14n') == etree.tostring(r_data, method='c14n'))
+    if not same_schema_source:
+        # Test the left schema against the right data and vice versa, when schemas were built
+        if l_schema is not None and not l_schema.validate(r_data):
+            errors.append('Left schema does not match right data')
+        if r_schema is not None and not r_schema.validate(l_data):
+            errors.append('Right schema does not match left data')
+    # Test the join properties exist in both files, stopping at the first match
+    # per file; one evaluator per document shares the XPath context across props
+    eval_l = etree.XPathEvaluator(l_data)
+    eval_r = etree.XPathEvaluator(r_data)
+    for prop in join_props_xpath:
+        if not _has_any(l_data, prop, eval_l) or not _has_any(r_data, prop, eval_r):
+            errors.append(f'Join property {prop} does not match to at least one element in both files')
+    if errors:
+        error_message = "\n\t".join(errors)
+        raise ValueError(f"Invalid XML data: \n\n\t{error_message}")
@@ -0,0 +1,27 @@
+"""
+Shared xpath helpers: plain-tag detection and the compiled XPath cache.
+"""
+import re
+
+from lxml import etree
+
+# Matches join properties that are plain tag names rather than full xpath expressions
+SIMPLE_TAG_RE = re.compile(r"[A-Za-z_][\w.-]*")
+
+# Cache of compiled XPath objects, keyed by the raw xpath string
+_XPATH_CACHE = {}
+
+
+def get_xp(prop: str) -> etree.XPath:
+    """Return a compiled XPath for the given string, compiling it at most once.
+
+    Args:
+        prop (str): The xpath string to compile
+
+    Returns:
+        etree.XPath: The compiled xpath
+    """
+    xpath = _XPATH_CACHE.get(prop)
+    if xpath is None:
+        xpath = _XPATH_CACHE[prop] = etree.XPath(prop)
+    return xpath